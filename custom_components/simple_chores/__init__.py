@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
 from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.area_registry import EVENT_AREA_REGISTRY_UPDATED
 from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 
 from . import frontend_resources
 from .const import (
-    ANCHOR_TYPES,
+    ANCHOR_TYPES_SET,
     ATTR_ANCHOR_DAY_OF_MONTH,
     ATTR_ANCHOR_DAYS_OF_WEEK,
     ATTR_ANCHOR_TYPE,
@@ -45,8 +48,8 @@ from .const import (
     DEFAULT_NOTIFICATIONS_ENABLED,
     DEFAULT_NOTIFY_DAYS_BEFORE,
     DOMAIN,
-    FREQUENCIES,
-    RECURRENCE_TYPES,
+    FREQUENCIES_SET,
+    RECURRENCE_TYPES_SET,
     SERVICE_ADD_CHORE,
     SERVICE_ADD_ROOM,
     SERVICE_ADD_USER,
@@ -62,10 +65,10 @@ from .const import (
     SERVICE_UPDATE_CHORE,
     SERVICE_UPDATE_ROOM,
     SERVICE_UPDATE_USER,
-    WEEK_ORDINALS,
-    WEEKDAYS,
+    WEEK_ORDINALS_SET,
+    WEEKDAYS_SET,
 )
-from .coordinator import SimpleChoresCoordinator
+from .coordinator import SimpleChoresConfigEntry, SimpleChoresCoordinator
 from .store import SimpleChoresStore
 
 _LOGGER = logging.getLogger(__name__)
@@ -76,7 +79,33 @@ PLATFORMS: list[Platform] = [
     Platform.CALENDAR,
 ]
 
+_DEFAULT_NOTIFICATION_TIME = dt_util.parse_time(DEFAULT_NOTIFICATION_TIME)
+# Coordinator data younger than this is reused for notifications without a refresh
+_NOTIFICATION_DATA_MAX_AGE = timedelta(seconds=60)
+# Labels for notification days that don't follow the "in N days" pattern
+_DUE_DATE_LABELS: dict[int, str] = {
+    0: "today",
+    1: "tomorrow",
+    7: "in 1 week",
+}
+# Maps user name characters to their notify service equivalents
+_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
 # Service schemas
+_FREQUENCY_VALIDATOR = vol.In(FREQUENCIES_SET)
+
+# Recurrence options shared by add_chore and update_chore; built once so both
+# schemas reuse the same validator instances.
+_RECURRENCE_FIELDS = {
+    vol.Optional(ATTR_RECURRENCE_TYPE): vol.In(RECURRENCE_TYPES_SET),
+    vol.Optional(ATTR_ANCHOR_DAYS_OF_WEEK): vol.All(cv.ensure_list, [vol.In(WEEKDAYS_SET)]),
+    vol.Optional(ATTR_ANCHOR_TYPE): vol.In(ANCHOR_TYPES_SET),
+    vol.Optional(ATTR_ANCHOR_DAY_OF_MONTH): vol.All(vol.Coerce(int), vol.Range(min=1, max=31)),
+    vol.Optional(ATTR_ANCHOR_WEEK): vol.In(WEEK_ORDINALS_SET),
+    vol.Optional(ATTR_ANCHOR_WEEKDAY): vol.In(WEEKDAYS_SET),
+    vol.Optional(ATTR_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+}
+
 SERVICE_ADD_ROOM_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_ROOM_NAME): cv.string,
@@ -123,17 +152,10 @@ SERVICE_ADD_CHORE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CHORE_NAME): cv.string,
         vol.Required(ATTR_ROOM_ID): cv.string,
-        vol.Required(ATTR_FREQUENCY): vol.In(FREQUENCIES),
+        vol.Required(ATTR_FREQUENCY): _FREQUENCY_VALIDATOR,
         vol.Optional(ATTR_START_DATE): cv.date,
         vol.Optional(ATTR_ASSIGNED_TO): cv.string,
-        # Recurrence options
-        vol.Optional(ATTR_RECURRENCE_TYPE): vol.In(RECURRENCE_TYPES),
-        vol.Optional(ATTR_ANCHOR_DAYS_OF_WEEK): vol.All(cv.ensure_list, [vol.In(WEEKDAYS)]),
-        vol.Optional(ATTR_ANCHOR_TYPE): vol.In(ANCHOR_TYPES),
-        vol.Optional(ATTR_ANCHOR_DAY_OF_MONTH): vol.All(vol.Coerce(int), vol.Range(min=1, max=31)),
-        vol.Optional(ATTR_ANCHOR_WEEK): vol.In(WEEK_ORDINALS),
-        vol.Optional(ATTR_ANCHOR_WEEKDAY): vol.In(WEEKDAYS),
-        vol.Optional(ATTR_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        **_RECURRENCE_FIELDS,
     }
 )
 
@@ -148,17 +170,10 @@ SERVICE_UPDATE_CHORE_SCHEMA = vol.Schema(
         vol.Required(ATTR_CHORE_ID): cv.string,
         vol.Optional(ATTR_CHORE_NAME): cv.string,
         vol.Optional(ATTR_ROOM_ID): cv.string,
-        vol.Optional(ATTR_FREQUENCY): vol.In(FREQUENCIES),
+        vol.Optional(ATTR_FREQUENCY): _FREQUENCY_VALIDATOR,
         vol.Optional(ATTR_NEXT_DUE): cv.date,
         vol.Optional(ATTR_ASSIGNED_TO): cv.string,
-        # Recurrence options
-        vol.Optional(ATTR_RECURRENCE_TYPE): vol.In(RECURRENCE_TYPES),
-        vol.Optional(ATTR_ANCHOR_DAYS_OF_WEEK): vol.All(cv.ensure_list, [vol.In(WEEKDAYS)]),
-        vol.Optional(ATTR_ANCHOR_TYPE): vol.In(ANCHOR_TYPES),
-        vol.Optional(ATTR_ANCHOR_DAY_OF_MONTH): vol.All(vol.Coerce(int), vol.Range(min=1, max=31)),
-        vol.Optional(ATTR_ANCHOR_WEEK): vol.In(WEEK_ORDINALS),
-        vol.Optional(ATTR_ANCHOR_WEEKDAY): vol.In(WEEKDAYS),
-        vol.Optional(ATTR_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        **_RECURRENCE_FIELDS,
     }
 )
 
@@ -188,10 +203,9 @@ SERVICE_GET_HISTORY_SCHEMA = vol.Schema(
 )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: SimpleChoresConfigEntry) -> bool:
     """Set up Simple Chores from a config entry."""
     _LOGGER.info("Setting up Simple Chores integration...")
-    hass.data.setdefault(DOMAIN, {})
 
     try:
         # Initialize store and load data
@@ -202,7 +216,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = SimpleChoresCoordinator(hass, store, entry)
         await coordinator.async_config_entry_first_refresh()
 
-        hass.data[DOMAIN][entry.entry_id] = coordinator
+        entry.runtime_data = coordinator
 
         # Set up platforms
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -217,30 +231,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise
 
     # Register services
-    await _async_setup_services(hass, coordinator)
+    _async_setup_services(hass, coordinator)
 
     # Set up notification scheduler
-    await _async_setup_notification_scheduler(hass, entry, coordinator)
+    _async_setup_notification_scheduler(hass, entry, coordinator)
+
+    # Keep the cached mobile app notify services in sync with the service registry
+    for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+        entry.async_on_unload(hass.bus.async_listen(event_type, coordinator.async_handle_service_change))
+
+    # Pick up added, renamed and removed Home Assistant areas
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_AREA_REGISTRY_UPDATED, coordinator.async_handle_area_registry_updated)
+    )
 
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # Register frontend resources
-    await frontend_resources.register_frontend_resources(hass, DOMAIN)
+    # Register frontend resources without holding up entry setup
+    entry.async_create_background_task(
+        hass,
+        frontend_resources.register_frontend_resources(hass, DOMAIN),
+        "simple_chores_frontend_resources",
+    )
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: SimpleChoresConfigEntry) -> bool:
     """Unload a config entry."""
     # Flush any pending saves before unloading
-    coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.store.async_flush_debounced_save()
-
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    await entry.runtime_data.store.async_flush_debounced_save()
 
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -248,292 +271,211 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-class ServiceHandlerFactory:
-    """Factory for creating service handlers with common patterns."""
-
-    def __init__(self, coordinator: SimpleChoresCoordinator, hass: HomeAssistant):
-        self.coordinator = coordinator
-        self.hass = hass
-
-    def create_room_handler(self, operation: str) -> Callable[[ServiceCall], Awaitable[None]]:
-        """Create a room operation handler."""
-
-        async def handler(call: ServiceCall) -> None:
-            try:
-                room_id = call.data.get(ATTR_ROOM_ID)
-                name = call.data.get(ATTR_ROOM_NAME)
-                icon = call.data.get(ATTR_ICON)
-
-                if operation == "add":
-                    await self.coordinator.async_add_room(name, icon)
-                    _LOGGER.info("Successfully added room: %s", name)
-                elif operation == "remove":
-                    await self.coordinator.async_remove_room(room_id)
-                    _LOGGER.info("Successfully removed room: %s", room_id)
-                elif operation == "update":
-                    await self.coordinator.async_update_room(room_id, name, icon)
-                    _LOGGER.info("Successfully updated room: %s", room_id)
-            except ValueError as e:
-                _LOGGER.error("Validation error in %s_room: %s", operation, e)
-                raise HomeAssistantError(f"Invalid input: {e}") from e
-            except KeyError as e:
-                _LOGGER.error("Missing required field in %s_room: %s", operation, e)
-                raise HomeAssistantError(f"Missing required field: {e}") from e
-            except Exception as e:
-                _LOGGER.exception("Unexpected error in %s_room", operation)
-                raise HomeAssistantError(f"Failed to {operation} room: {e}") from e
-
-        return handler
-
-    def create_user_handler(self, operation: str) -> Callable[[ServiceCall], Awaitable[None]]:
-        """Create a user operation handler."""
-
-        async def handler(call: ServiceCall) -> None:
-            try:
-                _LOGGER.info("=== User handler called for operation: %s ===", operation)
-                _LOGGER.info("Service call data: %s", dict(call.data))
-                _LOGGER.info("ATTR_USER_NAME constant value: %s", ATTR_USER_NAME)
-                _LOGGER.info("ATTR_AVATAR constant value: %s", ATTR_AVATAR)
-                _LOGGER.info("ATTR_USER_ID constant value: %s", ATTR_USER_ID)
-
-                user_id = call.data.get(ATTR_USER_ID)
-                name = call.data.get(ATTR_USER_NAME)
-                avatar = call.data.get(ATTR_AVATAR)
-
-                _LOGGER.info("Extracted values - user_id: %s, name: %s, avatar: %s", user_id, name, avatar)
-
-                if operation == "add":
-                    _LOGGER.info("Calling coordinator.async_add_user with name=%s, avatar=%s", name, avatar)
-                    await self.coordinator.async_add_user(name, avatar)
-                    _LOGGER.info("Successfully added custom user: %s", name)
-                elif operation == "remove":
-                    await self.coordinator.async_remove_user(user_id)
-                    _LOGGER.info("Successfully removed custom user: %s", user_id)
-                elif operation == "update":
-                    await self.coordinator.async_update_user(user_id, name, avatar)
-                    _LOGGER.info("Successfully updated custom user: %s", user_id)
-            except ValueError as e:
-                _LOGGER.error("Validation error in %s_user: %s", operation, e)
-                raise HomeAssistantError(f"Invalid input: {e}") from e
-            except KeyError as e:
-                _LOGGER.error("Missing required field in %s_user: %s", operation, e)
-                _LOGGER.error("KeyError details - Key: %s, Type: %s", e, type(e))
-                raise HomeAssistantError(f"Missing required field: {e}") from e
-            except Exception as e:
-                _LOGGER.exception("Unexpected error in %s_user", operation)
-                raise HomeAssistantError(f"Failed to {operation} user: {e}") from e
-
-        return handler
-
-    def create_chore_handler(self, operation: str) -> Callable[[ServiceCall], Awaitable[None]]:
-        """Create a chore operation handler."""
-
-        async def handler(call: ServiceCall) -> None:
-            try:
-                chore_id = call.data.get(ATTR_CHORE_ID)
-                name = call.data.get(ATTR_CHORE_NAME)
-                room_id = call.data.get(ATTR_ROOM_ID)
-                frequency = call.data.get(ATTR_FREQUENCY)
-                start_date = call.data.get(ATTR_START_DATE)
-                next_due = call.data.get(ATTR_NEXT_DUE)
-                assigned_to = call.data.get(ATTR_ASSIGNED_TO)
-                # Recurrence fields
-                recurrence_type = call.data.get(ATTR_RECURRENCE_TYPE)
-                anchor_days_of_week = call.data.get(ATTR_ANCHOR_DAYS_OF_WEEK)
-                anchor_type = call.data.get(ATTR_ANCHOR_TYPE)
-                anchor_day_of_month = call.data.get(ATTR_ANCHOR_DAY_OF_MONTH)
-                anchor_week = call.data.get(ATTR_ANCHOR_WEEK)
-                anchor_weekday = call.data.get(ATTR_ANCHOR_WEEKDAY)
-                interval = call.data.get(ATTR_INTERVAL)
-
-                if operation == "add":
-                    await self.coordinator.async_add_chore(
-                        name,
-                        room_id,
-                        frequency,
-                        start_date,
-                        assigned_to,
-                        recurrence_type,
-                        anchor_days_of_week,
-                        anchor_type,
-                        anchor_day_of_month,
-                        anchor_week,
-                        anchor_weekday,
-                        interval,
-                    )
-                    _LOGGER.info("Successfully added chore: %s", name)
-                elif operation == "remove":
-                    await self.coordinator.async_remove_chore(chore_id)
-                    _LOGGER.info("Successfully removed chore: %s", chore_id)
-                elif operation == "update":
-                    await self.coordinator.async_update_chore(
-                        chore_id,
-                        name,
-                        room_id,
-                        frequency,
-                        next_due,
-                        assigned_to,
-                        recurrence_type,
-                        anchor_days_of_week,
-                        anchor_type,
-                        anchor_day_of_month,
-                        anchor_week,
-                        anchor_weekday,
-                        interval,
-                    )
-                    _LOGGER.info("Successfully updated chore: %s", chore_id)
-                elif operation == "complete":
-                    user_id = call.data.get(ATTR_USER_ID)
-                    if user_id is None and call.context.user_id:
-                        user_id = call.context.user_id
-                    await self.coordinator.async_complete_chore(chore_id, user_id)
-                    _LOGGER.info("Successfully completed chore: %s by user: %s", chore_id, user_id)
-                elif operation == "skip":
-                    await self.coordinator.async_skip_chore(chore_id)
-                    _LOGGER.info("Successfully skipped chore: %s", chore_id)
-                elif operation == "snooze":
-                    await self.coordinator.async_snooze_chore(chore_id)
-                    _LOGGER.info("Successfully snoozed chore: %s", chore_id)
-            except ValueError as e:
-                _LOGGER.error("Validation error in %s_chore: %s", operation, e)
-                raise HomeAssistantError(f"Invalid input: {e}") from e
-            except KeyError as e:
-                _LOGGER.error("Missing required field in %s_chore: %s", operation, e)
-                raise HomeAssistantError(f"Missing required field: {e}") from e
-            except Exception as e:
-                _LOGGER.exception("Unexpected error in %s_chore", operation)
-                raise HomeAssistantError(f"Failed to {operation} chore: {e}") from e
-
-        return handler
-
-    def create_data_handler(self, data_type: str) -> Callable[[ServiceCall], Awaitable[dict[str, Any]]]:
-        """Create a data retrieval handler."""
-
-        async def handler(call: ServiceCall) -> dict[str, Any]:
-            try:
-                if data_type == "history":
-                    chore_id = call.data[ATTR_CHORE_ID]
-                    history = self.coordinator.store.get_chore_history(chore_id)
-                    _LOGGER.debug("Retrieved %d history entries for chore: %s", len(history), chore_id)
-                    return {"history": history}
-                elif data_type == "stats":
-                    stats = self.coordinator.store.get_user_stats()
-                    _LOGGER.debug("Retrieved stats for %d users", len(stats))
-                    return {"stats": stats}
-                else:
-                    raise HomeAssistantError(f"Unknown data type: {data_type}")
-            except KeyError as e:
-                _LOGGER.error("Missing required field in get_%s: %s", data_type, e)
-                raise HomeAssistantError(f"Missing required field: {e}") from e
-            except Exception as e:
-                _LOGGER.exception("Unexpected error in get_%s", data_type)
-                raise HomeAssistantError(f"Failed to get {data_type}: {e}") from e
-
-        return handler
+# Recurrence arguments in the order async_add_chore/async_update_chore expect them
+_RECURRENCE_ARGS = (
+    ATTR_RECURRENCE_TYPE,
+    ATTR_ANCHOR_DAYS_OF_WEEK,
+    ATTR_ANCHOR_TYPE,
+    ATTR_ANCHOR_DAY_OF_MONTH,
+    ATTR_ANCHOR_WEEK,
+    ATTR_ANCHOR_WEEKDAY,
+    ATTR_INTERVAL,
+)
 
-    def create_notification_handler(self) -> Callable[[ServiceCall], Awaitable[None]]:
-        """Create notification handler."""
+# Services that pass their call data straight through to a coordinator method:
+# (service_name, schema, coordinator_method, call data keys in argument order)
+_COORDINATOR_SERVICES: tuple[tuple[str, vol.Schema, str, tuple[str, ...]], ...] = (
+    # Room services
+    (SERVICE_ADD_ROOM, SERVICE_ADD_ROOM_SCHEMA, "async_add_room", (ATTR_ROOM_NAME, ATTR_ICON)),
+    (SERVICE_REMOVE_ROOM, SERVICE_REMOVE_ROOM_SCHEMA, "async_remove_room", (ATTR_ROOM_ID,)),
+    (SERVICE_UPDATE_ROOM, SERVICE_UPDATE_ROOM_SCHEMA, "async_update_room", (ATTR_ROOM_ID, ATTR_ROOM_NAME, ATTR_ICON)),
+    # User services
+    (SERVICE_ADD_USER, SERVICE_ADD_USER_SCHEMA, "async_add_user", (ATTR_USER_NAME, ATTR_AVATAR)),
+    (SERVICE_REMOVE_USER, SERVICE_REMOVE_USER_SCHEMA, "async_remove_user", (ATTR_USER_ID,)),
+    (SERVICE_UPDATE_USER, SERVICE_UPDATE_USER_SCHEMA, "async_update_user", (ATTR_USER_ID, ATTR_USER_NAME, ATTR_AVATAR)),
+    # Chore services
+    (
+        SERVICE_ADD_CHORE,
+        SERVICE_ADD_CHORE_SCHEMA,
+        "async_add_chore",
+        (ATTR_CHORE_NAME, ATTR_ROOM_ID, ATTR_FREQUENCY, ATTR_START_DATE, ATTR_ASSIGNED_TO, *_RECURRENCE_ARGS),
+    ),
+    (
+        SERVICE_UPDATE_CHORE,
+        SERVICE_UPDATE_CHORE_SCHEMA,
+        "async_update_chore",
+        (
+            ATTR_CHORE_ID,
+            ATTR_CHORE_NAME,
+            ATTR_ROOM_ID,
+            ATTR_FREQUENCY,
+            ATTR_NEXT_DUE,
+            ATTR_ASSIGNED_TO,
+            *_RECURRENCE_ARGS,
+        ),
+    ),
+    (SERVICE_REMOVE_CHORE, SERVICE_REMOVE_CHORE_SCHEMA, "async_remove_chore", (ATTR_CHORE_ID,)),
+    (SERVICE_SKIP_CHORE, SERVICE_SKIP_CHORE_SCHEMA, "async_skip_chore", (ATTR_CHORE_ID,)),
+    (SERVICE_SNOOZE_CHORE, SERVICE_SNOOZE_CHORE_SCHEMA, "async_snooze_chore", (ATTR_CHORE_ID,)),
+)
 
-        async def handler(call: ServiceCall) -> None:
-            try:
-                await _async_send_due_notification(self.hass, self.coordinator)
-                _LOGGER.info("Successfully sent notification")
-            except Exception as e:
-                _LOGGER.exception("Error sending notification")
-                raise HomeAssistantError(f"Failed to send notification: {e}") from e
 
-        return handler
+async def _async_handle_coordinator_service(
+    coordinator: SimpleChoresCoordinator,
+    method: str,
+    args: tuple[str, ...],
+    call: ServiceCall,
+) -> None:
+    """Call a coordinator method with the service call data as arguments."""
+    data = call.data
+    try:
+        await getattr(coordinator, method)(*[data.get(arg) for arg in args])
+        _LOGGER.info("Successfully handled %s: %s", call.service, data.get(args[0]))
+    except ValueError as e:
+        _LOGGER.error("Validation error in %s: %s", call.service, e)
+        raise HomeAssistantError(f"Invalid input: {e}") from e
+    except KeyError as e:
+        _LOGGER.error("Missing required field in %s: %s", call.service, e)
+        raise HomeAssistantError(f"Missing required field: {e}") from e
+    except Exception as e:
+        _LOGGER.exception("Unexpected error in %s", call.service)
+        raise HomeAssistantError(f"Failed to {call.service.replace('_', ' ')}: {e}") from e
+
+
+async def _async_handle_complete_chore(coordinator: SimpleChoresCoordinator, call: ServiceCall) -> None:
+    """Handle the complete_chore service."""
+    data = call.data
+    try:
+        chore_id = data[ATTR_CHORE_ID]
+        user_id = data.get(ATTR_USER_ID)
+        if user_id is None and call.context.user_id:
+            user_id = call.context.user_id
+        await coordinator.async_complete_chore(chore_id, user_id)
+        _LOGGER.info("Successfully completed chore: %s by user: %s", chore_id, user_id)
+    except ValueError as e:
+        _LOGGER.error("Validation error in complete_chore: %s", e)
+        raise HomeAssistantError(f"Invalid input: {e}") from e
+    except KeyError as e:
+        _LOGGER.error("Missing required field in complete_chore: %s", e)
+        raise HomeAssistantError(f"Missing required field: {e}") from e
+    except Exception as e:
+        _LOGGER.exception("Unexpected error in complete_chore")
+        raise HomeAssistantError(f"Failed to complete chore: {e}") from e
+
+
+async def _async_handle_get_history(coordinator: SimpleChoresCoordinator, call: ServiceCall) -> dict[str, Any]:
+    """Handle the get_history service."""
+    try:
+        chore_id = call.data[ATTR_CHORE_ID]
+        history = coordinator.store.get_chore_history(chore_id)
+        _LOGGER.debug("Retrieved %d history entries for chore: %s", len(history), chore_id)
+        return {"history": history}
+    except KeyError as e:
+        _LOGGER.error("Missing required field in get_history: %s", e)
+        raise HomeAssistantError(f"Missing required field: {e}") from e
+    except Exception as e:
+        _LOGGER.exception("Unexpected error in get_history")
+        raise HomeAssistantError(f"Failed to get history: {e}") from e
+
+
+async def _async_handle_get_user_stats(coordinator: SimpleChoresCoordinator, call: ServiceCall) -> dict[str, Any]:
+    """Handle the get_user_stats service."""
+    try:
+        stats = coordinator.store.get_user_stats()
+        _LOGGER.debug("Retrieved stats for %d users", len(stats))
+        return {"stats": stats}
+    except Exception as e:
+        _LOGGER.exception("Unexpected error in get_stats")
+        raise HomeAssistantError(f"Failed to get stats: {e}") from e
 
 
-async def _async_setup_services(hass: HomeAssistant, coordinator: SimpleChoresCoordinator) -> None:
-    """Set up services for the integration using factory pattern."""
+@callback
+def _async_handle_send_notification(
+    hass: HomeAssistant, coordinator: SimpleChoresCoordinator, call: ServiceCall
+) -> None:
+    """Handle the send_notification service."""
+    # Send in the background so the service call doesn't wait on every notify target
+    hass.async_create_task(
+        _async_send_due_notification(hass, coordinator),
+        name="simple_chores_notify",
+        eager_start=True,
+    )
 
-    factory = ServiceHandlerFactory(coordinator, hass)
 
-    # Service configuration: (service_name, handler_factory_method, schema)
+@callback
+def _async_setup_services(hass: HomeAssistant, coordinator: SimpleChoresCoordinator) -> None:
+    """Set up services for the integration."""
+    # Service configuration: (service_name, handler, schema)
     service_configs = [
-        # Room services
-        (SERVICE_ADD_ROOM, factory.create_room_handler("add"), SERVICE_ADD_ROOM_SCHEMA),
-        (SERVICE_REMOVE_ROOM, factory.create_room_handler("remove"), SERVICE_REMOVE_ROOM_SCHEMA),
-        (SERVICE_UPDATE_ROOM, factory.create_room_handler("update"), SERVICE_UPDATE_ROOM_SCHEMA),
-        # User services
-        (SERVICE_ADD_USER, factory.create_user_handler("add"), SERVICE_ADD_USER_SCHEMA),
-        (SERVICE_REMOVE_USER, factory.create_user_handler("remove"), SERVICE_REMOVE_USER_SCHEMA),
-        (SERVICE_UPDATE_USER, factory.create_user_handler("update"), SERVICE_UPDATE_USER_SCHEMA),
         # Chore services
-        (SERVICE_ADD_CHORE, factory.create_chore_handler("add"), SERVICE_ADD_CHORE_SCHEMA),
-        (SERVICE_REMOVE_CHORE, factory.create_chore_handler("remove"), SERVICE_REMOVE_CHORE_SCHEMA),
-        (SERVICE_UPDATE_CHORE, factory.create_chore_handler("update"), SERVICE_UPDATE_CHORE_SCHEMA),
-        (SERVICE_COMPLETE_CHORE, factory.create_chore_handler("complete"), SERVICE_COMPLETE_CHORE_SCHEMA),
-        (SERVICE_SKIP_CHORE, factory.create_chore_handler("skip"), SERVICE_SKIP_CHORE_SCHEMA),
-        (SERVICE_SNOOZE_CHORE, factory.create_chore_handler("snooze"), SERVICE_SNOOZE_CHORE_SCHEMA),
+        (SERVICE_COMPLETE_CHORE, partial(_async_handle_complete_chore, coordinator), SERVICE_COMPLETE_CHORE_SCHEMA),
         # Data services
-        (SERVICE_GET_HISTORY, factory.create_data_handler("history"), SERVICE_GET_HISTORY_SCHEMA),
-        (SERVICE_GET_USER_STATS, factory.create_data_handler("stats"), None),
+        (SERVICE_GET_HISTORY, partial(_async_handle_get_history, coordinator), SERVICE_GET_HISTORY_SCHEMA),
+        (SERVICE_GET_USER_STATS, partial(_async_handle_get_user_stats, coordinator), None),
         # Notification service
-        (SERVICE_SEND_NOTIFICATION, factory.create_notification_handler(), None),
+        (SERVICE_SEND_NOTIFICATION, partial(_async_handle_send_notification, hass, coordinator), None),
     ]
 
-    # Register all services using the factory pattern
     for service_name, handler, schema in service_configs:
         hass.services.async_register(DOMAIN, service_name, handler, schema=schema)
 
+    # Register pass-through services with the shared dispatcher
+    for service_name, schema, method, args in _COORDINATOR_SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            service_name,
+            partial(_async_handle_coordinator_service, coordinator, method, args),
+            schema=schema,
+        )
+
 
-async def _async_setup_notification_scheduler(
+@callback
+def _async_setup_notification_scheduler(
     hass: HomeAssistant,
     entry: ConfigEntry,
     coordinator: SimpleChoresCoordinator,
 ) -> None:
     """Set up the daily notification scheduler."""
+    # Options changes reload the entry, so when notifications are disabled there
+    # is nothing to schedule until the next reload
+    if not entry.options.get(CONF_NOTIFICATIONS_ENABLED, DEFAULT_NOTIFICATIONS_ENABLED):
+        return
 
     @callback
     def _schedule_notification(now: datetime) -> None:
-        """Schedule notification check."""
-        hass.async_create_task(_async_check_and_notify(hass, entry, coordinator))
+        """Schedule the due chores notification."""
+        hass.async_create_task(
+            _async_send_due_notification(hass, coordinator, entry),
+            name="simple_chores_notify",
+            eager_start=True,
+        )
 
-    # Get notification time from options
+    # Get notification time from options (the time selector stores HH:MM:SS)
     notification_time_str = entry.options.get(CONF_NOTIFICATION_TIME, DEFAULT_NOTIFICATION_TIME)
-
-    # Parse time string (HH:MM format)
-    try:
-        hour, minute = map(int, notification_time_str.split(":"))
-    except (ValueError, AttributeError):
-        hour, minute = 8, 0
+    notification_time = dt_util.parse_time(notification_time_str)
+    if notification_time is None:
+        _LOGGER.warning(
+            "Invalid notification time %r, defaulting to %s",
+            notification_time_str,
+            DEFAULT_NOTIFICATION_TIME,
+        )
+        notification_time = _DEFAULT_NOTIFICATION_TIME
 
     # Schedule daily notification
     entry.async_on_unload(
         async_track_time_change(
             hass,
             _schedule_notification,
-            hour=hour,
-            minute=minute,
+            hour=notification_time.hour,
+            minute=notification_time.minute,
             second=0,
         )
     )
 
 
-async def _async_check_and_notify(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    coordinator: SimpleChoresCoordinator,
-) -> None:
-    """Check for due chores and send notification if enabled."""
-    if not entry.options.get(CONF_NOTIFICATIONS_ENABLED, DEFAULT_NOTIFICATIONS_ENABLED):
-        return
-
-    await _async_send_due_notification(hass, coordinator, entry)
-
-
 def _get_due_date_label(days_ahead: int) -> str:
     """Get a human-readable label for the due date."""
-    if days_ahead == 0:
-        return "today"
-    elif days_ahead == 1:
-        return "tomorrow"
-    elif days_ahead == 7:
-        return "in 1 week"
-    else:
-        return f"in {days_ahead} days"
+    return _DUE_DATE_LABELS.get(days_ahead) or f"in {days_ahead} days"
 
 
 async def _async_send_due_notification(
@@ -542,8 +484,14 @@ async def _async_send_due_notification(
     entry: ConfigEntry | None = None,
 ) -> None:
     """Send targeted notifications about chores due based on configured days."""
-    # Refresh data first
-    await coordinator.async_request_refresh()
+    # Refresh data first, unless it was computed for today moments ago
+    if (
+        coordinator.data is None
+        or coordinator.last_refreshed is None
+        or coordinator.data["today"] != date.today().isoformat()
+        or dt_util.utcnow() - coordinator.last_refreshed > _NOTIFICATION_DATA_MAX_AGE
+    ):
+        await coordinator.async_request_refresh()
 
     if coordinator.data is None:
         return
@@ -553,41 +501,42 @@ async def _async_send_due_notification(
     if entry:
         days_before_list = entry.options.get(CONF_NOTIFY_DAYS_BEFORE, DEFAULT_NOTIFY_DAYS_BEFORE)
 
-    # Get all chores and filter for each notification day
-    all_chores = coordinator.data.get("all_chores", [])
+    # Bucket all active chores by due date in one pass
+    chores_by_due_date: dict[str, list[dict[str, Any]]] = {}
+    for chore in coordinator.data.get("chores", []):
+        chores_by_due_date.setdefault(chore["next_due"], []).append(chore)
     today = date.today()
 
-    # Get all mobile app notify services
-    all_mobile_apps = []
-    for service in hass.services.async_services().get("notify", {}):
-        if service.startswith("mobile_app_"):
-            all_mobile_apps.append(service)
+    # Get all mobile app notify services, with their lowercased device names for user matching
+    all_mobile_apps = coordinator.get_mobile_notify_services()
+    mobile_devices = [(service, service.removeprefix("mobile_app_").lower()) for service in all_mobile_apps]
 
     # Get configured notify targets
     configured_targets = []
     if entry:
         configured_targets = entry.options.get(CONF_NOTIFY_TARGETS, [])
 
+    # Assigned user_id -> (user_name, notify targets), shared across notification days
+    user_meta_cache: dict[str, tuple[str, list[str]]] = {}
+
     # Process notifications for each configured day
     for days_ahead in days_before_list:
         target_date = today + timedelta(days=days_ahead)
         target_date_str = target_date.isoformat()
 
         # Find chores due on this target date
-        chores_due = [chore for chore in all_chores if chore.get("next_due") == target_date_str]
+        chores_due = chores_by_due_date.get(target_date_str)
 
         if not chores_due:
             continue
 
         due_label = _get_due_date_label(days_ahead)
+        due_title = due_label.title()
 
         # Group chores by assigned user
         chores_by_user: dict[str | None, list[dict[str, Any]]] = {}
         for chore in chores_due:
-            assigned_to = chore.get("assigned_to")
-            if assigned_to not in chores_by_user:
-                chores_by_user[assigned_to] = []
-            chores_by_user[assigned_to].append(chore)
+            chores_by_user.setdefault(chore.get("assigned_to"), []).append(chore)
 
         # Send targeted notifications for assigned chores
         for user_id, user_chores in chores_by_user.items():
@@ -595,16 +544,21 @@ async def _async_send_due_notification(
                 # Unassigned chores - broadcast to all targets
                 targets = configured_targets if configured_targets else all_mobile_apps
                 await _async_send_notification_to_targets(
-                    hass, targets, user_chores, f"Unassigned Chores Due {due_label.title()}", due_label
+                    hass, targets, user_chores, f"Unassigned Chores Due {due_title}", due_label
                 )
             else:
-                # Assigned chores - send to specific user
-                user_name = await coordinator.async_get_user_name(user_id)
-                user_targets = await _async_find_user_notify_services(hass, user_id, user_name)
+                # Assigned chores - send to specific user (resolved once per run)
+                if (user_meta := user_meta_cache.get(user_id)) is None:
+                    user_name = await coordinator.async_get_user_name(user_id)
+                    user_meta = user_meta_cache[user_id] = (
+                        user_name,
+                        _find_user_notify_services(mobile_devices, user_name),
+                    )
+                user_name, user_targets = user_meta
 
                 if user_targets:
                     await _async_send_notification_to_targets(
-                        hass, user_targets, user_chores, f"{user_name}'s Chores Due {due_label.title()}", due_label
+                        hass, user_targets, user_chores, f"{user_name}'s Chores Due {due_title}", due_label
                     )
                 else:
                     _LOGGER.debug(
@@ -615,32 +569,22 @@ async def _async_send_due_notification(
                     # Fallback to broadcast if user's device not found
                     targets = configured_targets if configured_targets else all_mobile_apps
                     await _async_send_notification_to_targets(
-                        hass, targets, user_chores, f"{user_name}'s Chores Due {due_label.title()}", due_label
+                        hass, targets, user_chores, f"{user_name}'s Chores Due {due_title}", due_label
                     )
 
 
-async def _async_find_user_notify_services(hass: HomeAssistant, user_id: str, user_name: str) -> list[str]:
-    """Find mobile app notify services for a specific user."""
-    user_services = []
-
-    # Get all mobile app services
-    all_services = hass.services.async_services().get("notify", {})
+def _find_user_notify_services(mobile_devices: list[tuple[str, str]], user_name: str) -> list[str]:
+    """Find mobile app notify services for a specific user.
 
+    Args:
+        mobile_devices: (service, lowercased device name) pairs, e.g. ("mobile_app_john", "john")
+        user_name: The user's display name
+    """
     # Try to match by username (sanitized for service naming)
-    username_normalized = user_name.lower().replace(" ", "_").replace("-", "_")
-
-    for service in all_services:
-        if not service.startswith("mobile_app_"):
-            continue
-
-        # Extract device/user name from service (e.g., mobile_app_john -> john)
-        device_name = service.replace("mobile_app_", "")
+    username_normalized = user_name.lower().translate(_NAME_TRANS)
 
-        # Match if the device name contains the username
-        if username_normalized in device_name.lower():
-            user_services.append(service)
-
-    return user_services
+    # Match if the device name contains the username
+    return [service for service, device_name in mobile_devices if username_normalized in device_name]
 
 
 async def _async_send_notification_to_targets(
@@ -655,33 +599,35 @@ async def _async_send_notification_to_targets(
         return
 
     # Build notification message
-    chore_list = "\n".join([f"• {c['name']} ({c.get('room_name', 'Unknown')})" for c in chores])
+    chore_list = "\n".join(f"• {c['name']} ({c.get('room_name', 'Unknown')})" for c in chores)
     message = f"You have {len(chores)} chore(s) due {due_label}:\n{chore_list}"
 
-    # Send notifications
-    for target in targets:
-        try:
-            await hass.services.async_call(
-                "notify",
-                target,
+    # The payload is identical for every target, so build it once
+    payload = {
+        "title": title,
+        "message": message,
+        "data": {
+            "tag": f"simple_chores_due_{due_label.replace(' ', '_')}",
+            "actions": [
                 {
-                    "title": title,
-                    "message": message,
-                    "data": {
-                        "tag": f"simple_chores_due_{due_label.replace(' ', '_')}",
-                        "actions": [
-                            {
-                                "action": "OPEN_APP",
-                                "title": "Open Home Assistant",
-                            }
-                        ],
-                    },
-                },
-            )
-        except ServiceNotFound:
+                    "action": "OPEN_APP",
+                    "title": "Open Home Assistant",
+                }
+            ],
+        },
+    }
+
+    # Send notifications to all targets concurrently
+    results = await asyncio.gather(
+        *(hass.services.async_call("notify", target, payload) for target in targets),
+        return_exceptions=True,
+    )
+
+    # Don't raise - notification failures shouldn't break the integration
+    for target, result in zip(targets, results, strict=True):
+        if isinstance(result, ServiceNotFound):
             _LOGGER.warning("Notification service not found for target: %s", target)
-        except (HomeAssistantError, ValueError) as err:
-            _LOGGER.warning("Failed to send notification to %s: %s", target, err, exc_info=True)
-        except Exception:
-            _LOGGER.exception("Unexpected error sending notification to %s", target)
-            # Don't raise - notification failures shouldn't break the integration
+        elif isinstance(result, (HomeAssistantError, ValueError)):
+            _LOGGER.warning("Failed to send notification to %s: %s", target, result)
+        elif isinstance(result, Exception):
+            _LOGGER.error("Unexpected error sending notification to %s", target, exc_info=result)
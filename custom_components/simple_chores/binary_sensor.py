@@ -14,19 +14,21 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .coordinator import SimpleChoresConfigEntry, SimpleChoresCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities only read coordinator data, so updates need no throttling
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: SimpleChoresConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Simple Chores binary sensors from a config entry."""
-    coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     async_add_entities([SimpleChoresHasOverdueSensor(coordinator, entry)])
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -12,19 +15,28 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MAX_CALENDAR_EVENTS
-from .coordinator import SimpleChoresCoordinator, calculate_next_due
+from .const import FREQUENCY_ONCE, MAX_CALENDAR_EVENTS
+from .coordinator import FREQUENCY_DELTAS, SimpleChoresConfigEntry, SimpleChoresCoordinator, calculate_next_due
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities only read coordinator data, so updates need no throttling
+PARALLEL_UPDATES = 0
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date string, reusing results across calendar queries."""
+    return date.fromisoformat(value)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: SimpleChoresConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Simple Chores calendar from a config entry."""
-    coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     async_add_entities([SimpleChoresCalendar(coordinator, entry)])
 
@@ -40,18 +52,33 @@ class SimpleChoresCalendar(CoordinatorEntity[SimpleChoresCoordinator], CalendarE
         self._attr_unique_id = f"{entry.entry_id}_calendar"
         self._attr_name = "Simple Chores"
         self._attr_icon = "mdi:calendar-check"
+        # (coordinator data, date) the cached event was built for, and the event
+        self._event_cache: tuple[dict[str, Any], date, CalendarEvent | None] | None = None
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
 
+        # Reuse the event until the coordinator publishes new data or the day changes
+        today = date.today()
+        cached = self._event_cache
+        if cached is not None and cached[0] is data and cached[1] == today:
+            return cached[2]
+
+        event = self._build_next_event(data, today)
+        self._event_cache = (data, today, event)
+        return event
+
+    @staticmethod
+    def _build_next_event(data: dict[str, Any], today: date) -> CalendarEvent | None:
+        """Build the event for the chore due today or next."""
         # Get chores due today first
-        due_today = self.coordinator.data.get("due_today", [])
+        due_today = data.get("due_today", [])
         if due_today:
             chore = due_today[0]
-            today = date.today()
             return CalendarEvent(
                 start=today,
                 end=today + timedelta(days=1),
@@ -60,23 +87,17 @@ class SimpleChoresCalendar(CoordinatorEntity[SimpleChoresCoordinator], CalendarE
             )
 
         # Otherwise get next upcoming chore
-        chores = self.coordinator.data.get("chores", [])
-        if not chores:
+        chore = data.get("next_upcoming")
+        if chore is None:
             return None
 
-        # Find the next due chore
-        sorted_chores = sorted(chores, key=lambda c: c["next_due"])
-        if sorted_chores:
-            chore = sorted_chores[0]
-            due_date = date.fromisoformat(chore["next_due"])
-            return CalendarEvent(
-                start=due_date,
-                end=due_date + timedelta(days=1),
-                summary=chore["name"],
-                description=f"Room: {chore.get('room_name', 'Unknown')}\nFrequency: {chore['frequency']}",
-            )
-
-        return None
+        due_date = _parse_date(chore["next_due"])
+        return CalendarEvent(
+            start=due_date,
+            end=due_date + timedelta(days=1),
+            summary=chore["name"],
+            description=f"Room: {chore.get('room_name', 'Unknown')}\nFrequency: {chore['frequency']}",
+        )
 
     async def async_get_events(
         self,
@@ -85,10 +106,8 @@ class SimpleChoresCalendar(CoordinatorEntity[SimpleChoresCoordinator], CalendarE
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        events: list[CalendarEvent] = []
-
         if self.coordinator.data is None:
-            return events
+            return []
 
         chores = self.coordinator.data.get("chores", [])
         rooms = self.coordinator.data.get("rooms", [])
@@ -99,16 +118,28 @@ class SimpleChoresCalendar(CoordinatorEntity[SimpleChoresCoordinator], CalendarE
         start = start_date.date()
         end = end_date.date()
 
+        # Each chore's events are already in date order
+        chore_events: list[list[CalendarEvent]] = []
         for chore in chores:
+            try:
+                next_due = _parse_date(chore["next_due"])
+            except ValueError:
+                _LOGGER.warning("Invalid date format for chore %s: %s", chore["id"], chore["next_due"])
+                continue
+
+            # Chores only move forward in time, so one first due after the range has no events in it
+            if next_due > end:
+                continue
+
             # Generate events for this chore within the date range
-            chore_events = self._generate_chore_events(chore, room_names, start, end)
-            events.extend(chore_events)
+            chore_events.append(self._generate_chore_events(chore, next_due, room_names, start, end))
 
-        return sorted(events, key=lambda e: e.start)
+        return list(heapq.merge(*chore_events, key=attrgetter("start")))
 
     def _generate_chore_events(
         self,
         chore: dict[str, Any],
+        next_due: date,
         room_names: dict[str, str],
         start: date,
         end: date,
@@ -117,48 +148,63 @@ class SimpleChoresCalendar(CoordinatorEntity[SimpleChoresCoordinator], CalendarE
         events: list[CalendarEvent] = []
         room_name = room_names.get(chore["room_id"], "Unknown Room")
         frequency = chore["frequency"]
+        chore_id = chore["id"]
+        # Identical for every occurrence of this chore
+        summary = chore["name"]
+        description = f"Room: {room_name}\nFrequency: {frequency}"
+        one_day = timedelta(days=1)
 
         # Start from the chore's next due date
-        try:
-            current_due = date.fromisoformat(chore["next_due"])
-        except ValueError:
-            _LOGGER.warning("Invalid date format for chore %s: %s", chore["id"], chore["next_due"])
-            return []
+        current_due = next_due
+
+        # One-off chores occur only on their due date and never recur
+        if frequency == FREQUENCY_ONCE:
+            if not start <= current_due <= end:
+                return []
+            return [
+                CalendarEvent(
+                    start=current_due,
+                    end=current_due + one_day,
+                    summary=summary,
+                    description=description,
+                    uid=f"{chore_id}_{current_due.isoformat()}",
+                )
+            ]
 
         # If the due date is before our start, advance it until it's within range
-        while current_due < start:
-            try:
+        interval = FREQUENCY_DELTAS.get(frequency)
+        if interval is not None and current_due < start:
+            # Jump straight to the first occurrence on or after start
+            periods = -(-(start - current_due) // interval)
+            current_due += periods * interval
+
+        try:
+            while current_due < start:
                 current_due = calculate_next_due(current_due, frequency)
-            except (ValueError, OverflowError) as e:
-                _LOGGER.error("Invalid date calculation for chore %s: %s", chore["id"], e, exc_info=True)
-                break
-            except Exception:
-                _LOGGER.exception("Unexpected error calculating next due date for chore %s", chore["id"])
-                break
+        except (ValueError, OverflowError) as e:
+            _LOGGER.error("Invalid date calculation for chore %s: %s", chore_id, e, exc_info=True)
+        except Exception:
+            _LOGGER.exception("Unexpected error calculating next due date for chore %s", chore_id)
 
         # Generate events until we pass the end date
         # Limit events to prevent infinite loops
         count = 0
-        while current_due <= end and count < MAX_CALENDAR_EVENTS:
-            try:
+        try:
+            while current_due <= end and count < MAX_CALENDAR_EVENTS:
                 events.append(
                     CalendarEvent(
                         start=current_due,
-                        end=current_due + timedelta(days=1),
-                        summary=chore["name"],
-                        description=f"Room: {room_name}\nFrequency: {frequency}",
-                        uid=f"{chore['id']}_{current_due.isoformat()}",
+                        end=current_due + one_day,
+                        summary=summary,
+                        description=description,
+                        uid=f"{chore_id}_{current_due.isoformat()}",
                     )
                 )
                 current_due = calculate_next_due(current_due, frequency)
                 count += 1
-            except (ValueError, OverflowError) as e:
-                _LOGGER.error(
-                    "Invalid date calculation generating event for chore %s: %s", chore["id"], e, exc_info=True
-                )
-                break
-            except Exception:
-                _LOGGER.exception("Unexpected error generating calendar event for chore %s", chore["id"])
-                break
+        except (ValueError, OverflowError) as e:
+            _LOGGER.error("Invalid date calculation generating event for chore %s: %s", chore_id, e, exc_info=True)
+        except Exception:
+            _LOGGER.exception("Unexpected error generating calendar event for chore %s", chore_id)
 
         return events
@@ -24,6 +24,45 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options for a new entry; submitted user step values override these.
+# Notify targets are added per entry so no list is shared between entries.
+_USER_STEP_DEFAULTS: dict[str, Any] = {
+    CONF_NOTIFICATIONS_ENABLED: DEFAULT_NOTIFICATIONS_ENABLED,
+    CONF_NOTIFICATION_TIME: DEFAULT_NOTIFICATION_TIME,
+}
+
+# The initial setup form has no dynamic defaults, so it is built once
+_USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_NOTIFICATIONS_ENABLED,
+            default=DEFAULT_NOTIFICATIONS_ENABLED,
+        ): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_NOTIFICATION_TIME,
+            default=DEFAULT_NOTIFICATION_TIME,
+        ): selector.TimeSelector(),
+    }
+)
+
+# Options for days before notification
+_DAYS_BEFORE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="0", label="Day of (due today)"),
+            selector.SelectOptionDict(value="1", label="1 day before"),
+            selector.SelectOptionDict(value="2", label="2 days before"),
+            selector.SelectOptionDict(value="3", label="3 days before"),
+            selector.SelectOptionDict(value="7", label="1 week before"),
+        ],
+        multiple=True,
+        mode=selector.SelectSelectorMode.LIST,
+    )
+)
+
+# Free-text notify target entry, used when no notify services are registered
+_NOTIFY_TARGETS_TEXT_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
+
 
 class HouseholdTasksConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Household Tasks."""
@@ -40,29 +79,12 @@ class HouseholdTasksConfigFlow(ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title="Simple Chores",
                 data={},
-                options={
-                    CONF_NOTIFICATIONS_ENABLED: user_input.get(
-                        CONF_NOTIFICATIONS_ENABLED, DEFAULT_NOTIFICATIONS_ENABLED
-                    ),
-                    CONF_NOTIFICATION_TIME: user_input.get(CONF_NOTIFICATION_TIME, DEFAULT_NOTIFICATION_TIME),
-                    CONF_NOTIFY_TARGETS: user_input.get(CONF_NOTIFY_TARGETS, []),
-                },
+                options={**_USER_STEP_DEFAULTS, CONF_NOTIFY_TARGETS: [], **user_input},
             )
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_NOTIFICATIONS_ENABLED,
-                        default=DEFAULT_NOTIFICATIONS_ENABLED,
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_NOTIFICATION_TIME,
-                        default=DEFAULT_NOTIFICATION_TIME,
-                    ): selector.TimeSelector(),
-                }
-            ),
+            data_schema=_USER_STEP_SCHEMA,
         )
 
     @staticmethod
@@ -88,18 +110,10 @@ class HouseholdTasksOptionsFlow(OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         # Get list of notify services for target selection
-        notify_services = []
-        for service in self.hass.services.async_services().get("notify", {}):
-            if service != "notify":
-                notify_services.append(selector.SelectOptionDict(value=service, label=service))
-
-        # Options for days before notification
-        days_before_options = [
-            selector.SelectOptionDict(value="0", label="Day of (due today)"),
-            selector.SelectOptionDict(value="1", label="1 day before"),
-            selector.SelectOptionDict(value="2", label="2 days before"),
-            selector.SelectOptionDict(value="3", label="3 days before"),
-            selector.SelectOptionDict(value="7", label="1 week before"),
+        notify_services = [
+            selector.SelectOptionDict(value=service, label=service)
+            for service in self.hass.services.async_services_for_domain("notify")
+            if service != "notify"
         ]
 
         # Convert stored int list to string list for the selector
@@ -123,13 +137,7 @@ class HouseholdTasksOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_NOTIFY_DAYS_BEFORE,
                         default=current_days_str,
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=days_before_options,
-                            multiple=True,
-                            mode=selector.SelectSelectorMode.LIST,
-                        )
-                    ),
+                    ): _DAYS_BEFORE_SELECTOR,
                     vol.Optional(
                         CONF_NOTIFY_TARGETS,
                         default=self._config_entry.options.get(CONF_NOTIFY_TARGETS, []),
@@ -141,7 +149,7 @@ class HouseholdTasksOptionsFlow(OptionsFlow):
                         )
                     )
                     if notify_services
-                    else selector.TextSelector(selector.TextSelectorConfig(multiline=False)),
+                    else _NOTIFY_TARGETS_TEXT_SELECTOR,
                 }
             ),
         )
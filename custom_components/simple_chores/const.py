@@ -30,6 +30,7 @@ FREQUENCIES: Final = [
     FREQUENCY_BIANNUAL,
     FREQUENCY_YEARLY,
 ]
+FREQUENCIES_SET: Final = frozenset(FREQUENCIES)  # O(1) membership checks
 
 # Recurrence types
 RECURRENCE_INTERVAL: Final = "interval"  # Every N days/weeks/months from completion
@@ -39,6 +40,7 @@ RECURRENCE_TYPES: Final = [
     RECURRENCE_INTERVAL,
     RECURRENCE_ANCHORED,
 ]
+RECURRENCE_TYPES_SET: Final = frozenset(RECURRENCE_TYPES)
 
 # Anchor types for monthly/yearly recurrence
 ANCHOR_DAY_OF_MONTH: Final = "day_of_month"  # e.g., 15th of every month
@@ -48,6 +50,7 @@ ANCHOR_TYPES: Final = [
     ANCHOR_DAY_OF_MONTH,
     ANCHOR_WEEK_PATTERN,
 ]
+ANCHOR_TYPES_SET: Final = frozenset(ANCHOR_TYPES)
 
 # Week ordinals for week_pattern (1st, 2nd, 3rd, 4th, last)
 WEEK_FIRST: Final = 1
@@ -63,6 +66,7 @@ WEEK_ORDINALS: Final = [
     WEEK_FOURTH,
     WEEK_LAST,
 ]
+WEEK_ORDINALS_SET: Final = frozenset(WEEK_ORDINALS)
 
 # Days of week (Sunday = 0, Saturday = 6)
 WEEKDAY_SUNDAY: Final = 0
@@ -82,6 +86,7 @@ WEEKDAYS: Final = [
     WEEKDAY_FRIDAY,
     WEEKDAY_SATURDAY,
 ]
+WEEKDAYS_SET: Final = frozenset(WEEKDAYS)
 
 # Room prefixes
 ROOM_PREFIX_AREA: Final = "area_"
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import calendar
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
-from dateutil.relativedelta import relativedelta
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DOMAIN
+from homeassistant.core import Event, callback
+from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ANCHOR_DAY_OF_MONTH,
@@ -33,34 +38,54 @@ from .store import SimpleChoresStore
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
-    from homeassistant.helpers.area_registry import AreaRegistry
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Fixed-length frequencies and their interval (also used by the calendar)
+FREQUENCY_DELTAS: dict[str, timedelta] = {
+    FREQUENCY_DAILY: timedelta(days=1),
+    FREQUENCY_WEEKLY: timedelta(weeks=1),
+    FREQUENCY_BIWEEKLY: timedelta(weeks=2),
+}
+
+# Calendar-month frequencies and their length in months
+_FREQUENCY_MONTHS = {
+    FREQUENCY_MONTHLY: 1,
+    FREQUENCY_BIMONTHLY: 2,
+    FREQUENCY_QUARTERLY: 3,
+    FREQUENCY_BIANNUAL: 6,
+    FREQUENCY_YEARLY: 12,
+}
+
+
+@lru_cache(maxsize=4096)
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month."""
+    return calendar.monthrange(year, month)[1]
+
+
+def add_months(from_date: date, months: int) -> date:
+    """Add a number of months to a date, clamping the day to the end of the target month."""
+    year, month_index = divmod(from_date.year * 12 + from_date.month - 1 + months, 12)
+    month = month_index + 1
+    day = min(from_date.day, _days_in_month(year, month))
+    return date(year, month, day)
+
+
 def calculate_next_due(from_date: date, frequency: str) -> date | None:
     """Calculate the next due date based on frequency.
 
     Returns None for one-off chores (frequency='once'), indicating they should not be rescheduled.
     """
+    delta = FREQUENCY_DELTAS.get(frequency)
+    if delta is not None:
+        return from_date + delta
+    months = _FREQUENCY_MONTHS.get(frequency)
+    if months is not None:
+        return add_months(from_date, months)
     if frequency == FREQUENCY_ONCE:
         return None  # One-off chores don't get rescheduled
-    if frequency == FREQUENCY_DAILY:
-        return from_date + timedelta(days=1)
-    if frequency == FREQUENCY_WEEKLY:
-        return from_date + timedelta(weeks=1)
-    if frequency == FREQUENCY_BIWEEKLY:
-        return from_date + timedelta(weeks=2)
-    if frequency == FREQUENCY_MONTHLY:
-        return from_date + relativedelta(months=1)
-    if frequency == FREQUENCY_BIMONTHLY:
-        return from_date + relativedelta(months=2)
-    if frequency == FREQUENCY_QUARTERLY:
-        return from_date + relativedelta(months=3)
-    if frequency == FREQUENCY_BIANNUAL:
-        return from_date + relativedelta(months=6)
-    if frequency == FREQUENCY_YEARLY:
-        return from_date + relativedelta(years=1)
     return from_date
 
 
@@ -89,29 +114,23 @@ def get_nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> dat
     # Convert our weekday (Sunday=0) to Python's weekday (Monday=0)
     python_weekday = (weekday - 1) % 7  # Sunday(0)->6, Monday(1)->0, etc.
 
-    # Get first day of month and number of days in month
-    first_day = date(year, month, 1)
-    days_in_month = calendar.monthrange(year, month)[1]
+    # Get weekday of the first of the month and number of days in month
+    first_weekday = date(year, month, 1).weekday()
+    days_in_month = _days_in_month(year, month)
 
     if n == WEEK_LAST:
-        # Find last occurrence - start from end of month
-        last_day = date(year, month, days_in_month)
-        days_back = (last_day.weekday() - python_weekday) % 7
-        result = last_day - timedelta(days=days_back)
-        return result
+        # Find last occurrence - step back from the end of the month
+        last_weekday = (first_weekday + days_in_month - 1) % 7
+        return date(year, month, days_in_month - (last_weekday - python_weekday) % 7)
 
-    # Find first occurrence of this weekday
-    days_ahead = (python_weekday - first_day.weekday()) % 7
-    first_occurrence = first_day + timedelta(days=days_ahead)
-
-    # Calculate nth occurrence
-    result = first_occurrence + timedelta(weeks=n - 1)
+    # Day of month of the first occurrence, then of the nth
+    day = 1 + (python_weekday - first_weekday) % 7 + (n - 1) * 7
 
     # Check if still in same month
-    if result.month != month:
+    if day > days_in_month:
         return None
 
-    return result
+    return date(year, month, day)
 
 
 def calculate_next_anchored_weekly(
@@ -132,29 +151,22 @@ def calculate_next_anchored_weekly(
     if not anchor_days:
         return from_date + timedelta(weeks=interval)
 
-    # Sort anchor days
-    sorted_days = sorted(anchor_days)
-
     # Get current day of week (convert Python's Monday=0 to our Sunday=0)
     current_dow = (from_date.weekday() + 1) % 7
 
     # Find next anchor day in current week
-    for day in sorted_days:
-        if day > current_dow:
-            # Found a day later this week
-            days_ahead = day - current_dow
-            return from_date + timedelta(days=days_ahead)
+    next_day = min((day for day in anchor_days if day > current_dow), default=None)
+    if next_day is not None:
+        return from_date + timedelta(days=next_day - current_dow)
 
     # No more days this week - go to first anchor day of next interval
-    # Calculate days until next week's first anchor day
-    first_anchor = sorted_days[0]
-    days_until_sunday = (7 - current_dow) % 7 or 7  # Days until next Sunday
-    days_from_sunday_to_anchor = first_anchor
+    # Days until next Sunday, plus days from Sunday to the first anchor day
+    days_until_anchor = 7 - current_dow + min(anchor_days)
 
     # If interval > 1, skip additional weeks
     extra_weeks = (interval - 1) * 7
 
-    return from_date + timedelta(days=days_until_sunday + days_from_sunday_to_anchor + extra_weeks)
+    return from_date + timedelta(days=days_until_anchor + extra_weeks)
 
 
 def calculate_next_anchored_monthly(
@@ -184,7 +196,7 @@ def calculate_next_anchored_monthly(
 
         # Try current month first
         year, month = from_date.year, from_date.month
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _days_in_month(year, month)
         actual_day = min(target_day, days_in_month)
         target_date = date(year, month, actual_day)
 
@@ -192,16 +204,16 @@ def calculate_next_anchored_monthly(
             return target_date
 
         # Move to next month interval
-        next_month_date = from_date + relativedelta(months=months_interval)
+        next_month_date = add_months(from_date, months_interval)
         year, month = next_month_date.year, next_month_date.month
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _days_in_month(year, month)
         actual_day = min(target_day, days_in_month)
         return date(year, month, actual_day)
 
     elif anchor_type == ANCHOR_WEEK_PATTERN:
         # Week pattern (e.g., 2nd Tuesday of every month)
         if anchor_week is None or anchor_weekday is None:
-            return from_date + relativedelta(months=months_interval)
+            return add_months(from_date, months_interval)
 
         # Try current month first
         year, month = from_date.year, from_date.month
@@ -211,7 +223,7 @@ def calculate_next_anchored_monthly(
             return target_date
 
         # Move to next month interval
-        next_month_date = from_date + relativedelta(months=months_interval)
+        next_month_date = add_months(from_date, months_interval)
         year, month = next_month_date.year, next_month_date.month
         target_date = get_nth_weekday_of_month(year, month, anchor_weekday, anchor_week)
 
@@ -219,14 +231,14 @@ def calculate_next_anchored_monthly(
         # keep trying subsequent months
         attempts = 0
         while target_date is None and attempts < 12:
-            next_month_date = next_month_date + relativedelta(months=1)
+            next_month_date = add_months(next_month_date, 1)
             year, month = next_month_date.year, next_month_date.month
             target_date = get_nth_weekday_of_month(year, month, anchor_weekday, anchor_week)
             attempts += 1
 
-        return target_date or from_date + relativedelta(months=months_interval)
+        return target_date or add_months(from_date, months_interval)
 
-    return from_date + relativedelta(months=months_interval)
+    return add_months(from_date, months_interval)
 
 
 def calculate_next_due_for_chore(chore: dict[str, Any], from_date: date) -> date | None:
@@ -262,13 +274,7 @@ def calculate_next_due_for_chore(chore: dict[str, Any], from_date: date) -> date
 
     elif frequency in (FREQUENCY_MONTHLY, FREQUENCY_BIMONTHLY, FREQUENCY_QUARTERLY, FREQUENCY_BIANNUAL):
         anchor_type = chore.get("anchor_type", ANCHOR_DAY_OF_MONTH)
-        months_map = {
-            FREQUENCY_MONTHLY: 1,
-            FREQUENCY_BIMONTHLY: 2,
-            FREQUENCY_QUARTERLY: 3,
-            FREQUENCY_BIANNUAL: 6,
-        }
-        months_interval = months_map.get(frequency, 1) * interval
+        months_interval = _FREQUENCY_MONTHS[frequency] * interval
         return calculate_next_anchored_monthly(
             from_date,
             anchor_type,
@@ -315,18 +321,26 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.store = store
         self.config_entry = config_entry
-        self._room_name_cache: dict[str, str] | None = {}
+        self._room_name_cache: dict[str, str] | None = None
+        self._all_rooms_cache: list[dict[str, Any]] | None = None
+        self._room_ids_cache: frozenset[str] | None = None
+        self._mobile_notify_services: list[str] | None = None
+        self.last_refreshed: datetime | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Calculate due chores and prepare data for entities."""
         today = date.today()
         # Use rolling 7-day window instead of calendar week
         next_seven_days = today + timedelta(days=7)
+        # ISO dates compare chronologically as strings, so next_due needs no parsing
+        today_iso = today.isoformat()
+        next_seven_days_iso = next_seven_days.isoformat()
 
         # Get all rooms (HA Areas + custom)
-        # Cache is only cleared when rooms are modified, not on every update
+        # Cache is only cleared when rooms or areas are modified, not on every update
         all_rooms = await self._get_all_rooms()
-        _LOGGER.debug("Available rooms: %s", [(room["id"], room["name"]) for room in all_rooms])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Available rooms: %s", [(room["id"], room["name"]) for room in all_rooms])
 
         # Categorize chores
         due_today: list[dict[str, Any]] = []
@@ -334,55 +348,44 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         overdue: list[dict[str, Any]] = []
         all_active_chores: list[dict[str, Any]] = []
         by_room: dict[str, list[dict[str, Any]]] = {room["id"]: [] for room in all_rooms}
+        room_names = self._get_room_names(all_rooms)
 
         for chore in self.store.chores.values():
             # Skip completed one-off chores
             if chore.get("is_completed", False):
                 continue
 
-            next_due = date.fromisoformat(chore["next_due"])
-            room_name = self._get_room_name(chore["room_id"], all_rooms)
-            chore_with_room = {
-                **chore,
-                "room_name": room_name,
-            }
+            next_due = chore["next_due"]
+            room_id = chore["room_id"]
+            room_name = room_names.get(room_id, "Unknown Room")
+            # One copy per chore, shared by every list it's categorised into
+            chore_with_room = chore.copy()
+            chore_with_room["room_name"] = room_name
 
             # Add to all active chores list (with room_name)
             all_active_chores.append(chore_with_room)
 
-            # Debug logging for troubleshooting
-            _LOGGER.debug(
-                "Chore: %s, Room ID: %s, Room Name: %s, Next Due: %s, Assigned To: %s",
-                chore["name"],
-                chore["room_id"],
-                room_name,
-                chore["next_due"],
-                chore.get("assigned_to"),
-            )
-
             # Categorize by due date
-            if next_due < today:
+            if next_due < today_iso:
                 overdue.append(chore_with_room)
                 # Overdue items are also due today
                 due_today.append(chore_with_room)
-            elif next_due == today:
+            elif next_due == today_iso:
                 due_today.append(chore_with_room)
-
-            # Due in next 7 days (rolling window, not calendar week)
-            if today < next_due <= next_seven_days:
+            elif next_due <= next_seven_days_iso:
+                # Due in next 7 days (rolling window, not calendar week)
                 due_this_week.append(chore_with_room)
 
-            # Group by room
-            room_id = chore["room_id"]
-            if room_id in by_room:
-                by_room[room_id].append(chore_with_room)
+            # Group by room; chores whose room has since been removed keep
+            # their own bucket instead of being dropped
+            by_room.setdefault(room_id, []).append(chore_with_room)
 
         # Get all users (HA + custom)
         all_users = await self.async_get_users()
 
         result = {
-            "today": today.isoformat(),
-            "seven_days_from_today": next_seven_days.isoformat(),
+            "today": today_iso,
+            "seven_days_from_today": next_seven_days_iso,
             "due_today": due_today,
             "due_today_count": len(due_today),
             "due_this_week": due_this_week,
@@ -395,6 +398,8 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "users": all_users,
             "chores": all_active_chores,
             "total_chores": len(all_active_chores),
+            # ISO dates sort chronologically, so the string minimum is the next chore due
+            "next_upcoming": min(all_active_chores, key=itemgetter("next_due"), default=None),
         }
 
         _LOGGER.debug(
@@ -405,16 +410,18 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             len(overdue),
         )
 
+        self.last_refreshed = dt_util.utcnow()
         return result
 
     async def _get_all_rooms(self) -> list[dict[str, Any]]:
         """Get all rooms from HA Area Registry and custom rooms."""
+        if self._all_rooms_cache is not None:
+            return self._all_rooms_cache
+
         rooms: list[dict[str, Any]] = []
 
         # Get HA Areas
-        from homeassistant.helpers import area_registry as ar
-
-        area_registry: AreaRegistry = ar.async_get(self.hass)
+        area_registry = ar.async_get(self.hass)
         for area in area_registry.async_list_areas():
             rooms.append(
                 {
@@ -429,18 +436,49 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         for room in self.store.rooms.values():
             rooms.append(room)
 
+        self._all_rooms_cache = rooms
         return rooms
 
+    async def _get_valid_room_ids(self) -> frozenset[str]:
+        """Get the IDs of all rooms a chore can be assigned to."""
+        if self._room_ids_cache is None:
+            all_rooms = await self._get_all_rooms()
+            self._room_ids_cache = frozenset(room["id"] for room in all_rooms)
+        return self._room_ids_cache
+
     def _invalidate_room_cache(self) -> None:
-        """Invalidate the room name cache when rooms are modified."""
+        """Invalidate the room caches when rooms are modified."""
+        self._all_rooms_cache = None
+        self._room_ids_cache = None
         self._room_name_cache = None
 
-    def _get_room_name(self, room_id: str, all_rooms: list[dict[str, Any]]) -> str:
-        """Get the display name for a room."""
-        # Build cache once if empty or invalidated
-        if not self._room_name_cache:
+    @callback
+    def async_handle_area_registry_updated(self, event: Event) -> None:
+        """Invalidate the room caches when a Home Assistant area changes."""
+        self._invalidate_room_cache()
+
+    def _get_room_names(self, all_rooms: list[dict[str, Any]]) -> dict[str, str]:
+        """Get the display names of all rooms, keyed by room ID."""
+        # Build cache once if invalidated (an empty dict is a valid cache)
+        if self._room_name_cache is None:
             self._room_name_cache = {room["id"]: room["name"] for room in all_rooms}
-        return self._room_name_cache.get(room_id, "Unknown Room")
+        return self._room_name_cache
+
+    def get_mobile_notify_services(self) -> list[str]:
+        """Get all mobile app notify services (cached until the notify services change)."""
+        if self._mobile_notify_services is None:
+            self._mobile_notify_services = [
+                service
+                for service in self.hass.services.async_services_for_domain("notify")
+                if service.startswith("mobile_app_")
+            ]
+        return self._mobile_notify_services
+
+    @callback
+    def async_handle_service_change(self, event: Event) -> None:
+        """Invalidate the notify service cache when a notify service is added or removed."""
+        if event.data.get(ATTR_DOMAIN) == "notify":
+            self._mobile_notify_services = None
 
     async def async_get_users(self) -> list[dict[str, Any]]:
         """Get all users (HA users + custom users)."""
@@ -475,11 +513,10 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return self.store.users[user_id]["name"]
 
         # Check HA users
-        users = await self.hass.auth.async_get_users()
-        for user in users:
-            if user.id == user_id:
-                return user.name or user_id
-        return user_id
+        user = await self.hass.auth.async_get_user(user_id)
+        if user is None:
+            return user_id
+        return user.name or user_id
 
     async def async_complete_chore(self, chore_id: str, user_id: str | None = None) -> dict[str, Any] | None:
         """Complete a chore and reschedule it."""
@@ -609,9 +646,7 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> dict[str, Any]:
         """Add a new chore."""
         # Validate room exists before creating chore
-        all_rooms = await self._get_all_rooms()
-        valid_room_ids = {room["id"] for room in all_rooms}
-        if room_id not in valid_room_ids:
+        if room_id not in await self._get_valid_room_ids():
             raise ValueError(
                 f"Invalid room ID: {room_id}. Room does not exist. "
                 f"Please create the room first or use an existing HA Area."
@@ -660,14 +695,11 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> dict[str, Any] | None:
         """Update an existing chore."""
         # Validate room exists if room_id is being updated
-        if room_id is not None:
-            all_rooms = await self._get_all_rooms()
-            valid_room_ids = {room["id"] for room in all_rooms}
-            if room_id not in valid_room_ids:
-                raise ValueError(
-                    f"Invalid room ID: {room_id}. Room does not exist. "
-                    f"Please create the room first or use an existing HA Area."
-                )
+        if room_id is not None and room_id not in await self._get_valid_room_ids():
+            raise ValueError(
+                f"Invalid room ID: {room_id}. Room does not exist. "
+                f"Please create the room first or use an existing HA Area."
+            )
 
         chore = self.store.update_chore(
             chore_id,
@@ -696,3 +728,7 @@ class SimpleChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self.store.async_save()  # Use immediate save for deletions
             await self.async_request_refresh()
         return result
+
+
+# Config entry whose runtime_data holds the coordinator
+SimpleChoresConfigEntry = ConfigEntry[SimpleChoresCoordinator]
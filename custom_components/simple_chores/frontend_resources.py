@@ -8,11 +8,18 @@ import os
 import shutil
 from typing import TYPE_CHECKING
 
+from homeassistant.util.json import json_loads
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+_CARD_FILENAME = "simple-chores-card.js"
+_INTEGRATION_DIR = os.path.dirname(__file__)
+_MANIFEST_PATH = os.path.join(_INTEGRATION_DIR, "manifest.json")
+_CARD_SOURCE_PATH = os.path.join(_INTEGRATION_DIR, "www", _CARD_FILENAME)
+
 
 def _get_integration_version() -> str:
     """Read version from manifest.json for cache busting.
@@ -21,9 +28,8 @@ def _get_integration_version() -> str:
         Version string from manifest, or 'unknown' if not found.
     """
     try:
-        manifest_path = os.path.join(os.path.dirname(__file__), "manifest.json")
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
+        with open(_MANIFEST_PATH, "rb") as f:
+            manifest = json_loads(f.read())
             return manifest.get("version", "unknown")
     except (OSError, json.JSONDecodeError) as err:
         _LOGGER.warning("Could not read version from manifest: %s", err)
@@ -42,21 +48,19 @@ async def register_frontend_resources(hass: HomeAssistant, domain: str) -> None:
     """
     try:
         # Validate card file exists
-        source_path = hass.config.path(f"custom_components/{domain}/www")
-        card_file = os.path.join(source_path, "simple-chores-card.js")
-
-        if not os.path.exists(card_file):
-            _LOGGER.error("Card file not found at: %s", card_file)
+        if not os.path.exists(_CARD_SOURCE_PATH):
+            _LOGGER.error("Card file not found at: %s", _CARD_SOURCE_PATH)
             _LOGGER.error(
-                "Please ensure simple-chores-card.js exists in custom_components/%s/www/",
+                "Please ensure %s exists in custom_components/%s/www/",
+                _CARD_FILENAME,
                 domain,
             )
             return
 
-        _LOGGER.debug("Found card file: %s", card_file)
+        _LOGGER.debug("Found card file: %s", _CARD_SOURCE_PATH)
 
         # Register using HACS-compatible approach
-        await _register_hacs_compatible(hass, domain, card_file)
+        await _register_hacs_compatible(hass, domain, _CARD_SOURCE_PATH)
 
     except OSError as err:
         _LOGGER.error("File system error during frontend registration: %s", err, exc_info=True)
@@ -82,23 +86,34 @@ async def _register_hacs_compatible(hass: HomeAssistant, domain: str, source_fil
 
         # Define target directory following HACS convention
         target_dir = hass.config.path(f"www/community/{domain}")
-        target_file = os.path.join(target_dir, "simple-chores-card.js")
+        target_file = os.path.join(target_dir, _CARD_FILENAME)
+
+        # Copy file to HACS community folder and read the version in a single
+        # executor job, keeping all blocking file I/O off the event loop
+        def _install_card_file() -> str:
+            """Copy card file to target directory and return the version (runs in executor)."""
+            # Skip the copy when the target is already up to date. copy2 preserves
+            # mtime, so an unchanged source has the same size and mtime as the target.
+            src_stat = os.stat(source_file)
+            try:
+                dst_stat = os.stat(target_file)
+            except FileNotFoundError:
+                dst_stat = None
+            if dst_stat and dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                _LOGGER.debug("Card already up to date at: %s", target_file)
+            else:
+                os.makedirs(target_dir, exist_ok=True)
+                shutil.copy2(source_file, target_file)
+                _LOGGER.debug("Copied card to: %s", target_file)
+
+            return _get_integration_version()
 
         # Get version for cache busting
-        version = _get_integration_version()
-        card_url = f"/local/community/{domain}/simple-chores-card.js?v={version}"
+        version = await hass.async_add_executor_job(_install_card_file)
+        card_url = f"/local/community/{domain}/{_CARD_FILENAME}?v={version}"
 
         _LOGGER.debug("Using version %s for cache busting", version)
 
-        # Copy file to HACS community folder (async to avoid blocking)
-        def _copy_card_file() -> None:
-            """Copy card file to target directory (runs in executor)."""
-            os.makedirs(target_dir, exist_ok=True)
-            shutil.copy2(source_file, target_file)
-            _LOGGER.debug("Copied card to: %s", target_file)
-
-        await hass.async_add_executor_job(_copy_card_file)
-
         # Register with Home Assistant frontend
         add_extra_js_url(hass, card_url)
 
@@ -12,24 +12,26 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DOMAIN,
     SENSOR_DUE_NEXT_7_DAYS,
     SENSOR_DUE_TODAY,
     SENSOR_OVERDUE,
     SENSOR_TOTAL,
 )
-from .coordinator import SimpleChoresCoordinator
+from .coordinator import SimpleChoresConfigEntry, SimpleChoresCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities only read coordinator data, so updates need no throttling
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: SimpleChoresConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Simple Chores sensors from a config entry."""
-    coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities: list[SensorEntity] = [
         SimpleChoresDueTodaySensor(coordinator, entry),
@@ -13,16 +13,19 @@ from homeassistant.helpers.storage import Store
 
 from .const import (
     ANCHOR_TYPES,
+    ANCHOR_TYPES_SET,
     FREQUENCIES,
+    FREQUENCIES_SET,
     MAX_CHORE_NAME_LENGTH,
     MAX_HISTORY_ENTRIES,
     MAX_ROOM_NAME_LENGTH,
     RECURRENCE_INTERVAL,
     RECURRENCE_TYPES,
+    RECURRENCE_TYPES_SET,
     STORAGE_KEY,
     STORAGE_VERSION,
-    WEEK_ORDINALS,
-    WEEKDAYS,
+    WEEK_ORDINALS_SET,
+    WEEKDAYS_SET,
 )
 
 if TYPE_CHECKING:
@@ -276,12 +279,12 @@ class SimpleChoresStore:
 
         # Normalize frequency to lowercase for case-insensitive comparison
         frequency = frequency.lower()
-        if frequency not in FREQUENCIES:
+        if frequency not in FREQUENCIES_SET:
             raise ValueError(f"Invalid frequency: {frequency}. Must be one of: {FREQUENCIES}")
 
         # Validate recurrence type
         recurrence_type = recurrence_type or RECURRENCE_INTERVAL
-        if recurrence_type not in RECURRENCE_TYPES:
+        if recurrence_type not in RECURRENCE_TYPES_SET:
             raise ValueError(f"Invalid recurrence type: {recurrence_type}. Must be one of: {RECURRENCE_TYPES}")
 
         # Validate anchor fields if anchored recurrence
@@ -343,23 +346,23 @@ class SimpleChoresStore:
             if not anchor_days_of_week:
                 raise ValueError("Weekly anchored recurrence requires anchor_days_of_week")
             for day in anchor_days_of_week:
-                if day not in WEEKDAYS:
+                if day not in WEEKDAYS_SET:
                     raise ValueError(f"Invalid day of week: {day}. Must be 0-6 (Sunday-Saturday)")
 
         elif frequency in ("monthly", "bimonthly", "quarterly", "biannual"):
             # Monthly anchored requires anchor_type
             if not anchor_type:
                 raise ValueError("Monthly anchored recurrence requires anchor_type")
-            if anchor_type not in ANCHOR_TYPES:
+            if anchor_type not in ANCHOR_TYPES_SET:
                 raise ValueError(f"Invalid anchor type: {anchor_type}. Must be one of: {ANCHOR_TYPES}")
 
             if anchor_type == "day_of_month":
                 if anchor_day_of_month is None or anchor_day_of_month < 1 or anchor_day_of_month > 31:
                     raise ValueError("anchor_day_of_month must be between 1 and 31")
             elif anchor_type == "week_pattern":
-                if anchor_week not in WEEK_ORDINALS:
+                if anchor_week not in WEEK_ORDINALS_SET:
                     raise ValueError(f"Invalid anchor_week: {anchor_week}. Must be 1-5 (1st-4th, or 5 for last)")
-                if anchor_weekday not in WEEKDAYS:
+                if anchor_weekday not in WEEKDAYS_SET:
                     raise ValueError(f"Invalid anchor_weekday: {anchor_weekday}. Must be 0-6 (Sunday-Saturday)")
 
         elif frequency == "yearly":
@@ -390,7 +393,7 @@ class SimpleChoresStore:
         # Normalize frequency to lowercase if provided
         if frequency is not None:
             frequency = frequency.lower()
-            if frequency not in FREQUENCIES:
+            if frequency not in FREQUENCIES_SET:
                 raise ValueError(f"Invalid frequency: {frequency}. Must be one of: {FREQUENCIES}")
 
         # Validate room ID format if provided
@@ -398,7 +401,7 @@ class SimpleChoresStore:
             raise ValueError(f"Invalid room ID format: {room_id}. Room IDs must start with 'area_' or 'custom_'")
 
         # Validate recurrence type if provided
-        if recurrence_type is not None and recurrence_type not in RECURRENCE_TYPES:
+        if recurrence_type is not None and recurrence_type not in RECURRENCE_TYPES_SET:
             raise ValueError(f"Invalid recurrence type: {recurrence_type}. Must be one of: {RECURRENCE_TYPES}")
 
         chore = self._data["chores"][chore_id]
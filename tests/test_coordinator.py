@@ -7,10 +7,10 @@ from __future__ import annotations
 
 import calendar
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
 import pytest
-from dateutil.relativedelta import relativedelta
 
 # Constants (copied from const.py to avoid HA import chain)
 FREQUENCY_ONCE = "once"
@@ -44,27 +44,48 @@ WEEKDAY_FRIDAY = 5
 WEEKDAY_SATURDAY = 6
 
 
+# Fixed-length frequencies and their interval
+FREQUENCY_DELTAS = {
+    FREQUENCY_DAILY: timedelta(days=1),
+    FREQUENCY_WEEKLY: timedelta(weeks=1),
+    FREQUENCY_BIWEEKLY: timedelta(weeks=2),
+}
+
+# Calendar-month frequencies and their length in months
+_FREQUENCY_MONTHS = {
+    FREQUENCY_MONTHLY: 1,
+    FREQUENCY_BIMONTHLY: 2,
+    FREQUENCY_QUARTERLY: 3,
+    FREQUENCY_BIANNUAL: 6,
+    FREQUENCY_YEARLY: 12,
+}
+
+
 # Copy the pure functions from coordinator.py to test them without HA imports
+@lru_cache(maxsize=4096)
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month."""
+    return calendar.monthrange(year, month)[1]
+
+
+def add_months(from_date: date, months: int) -> date:
+    """Add a number of months to a date, clamping the day to the end of the target month."""
+    year, month_index = divmod(from_date.year * 12 + from_date.month - 1 + months, 12)
+    month = month_index + 1
+    day = min(from_date.day, _days_in_month(year, month))
+    return date(year, month, day)
+
+
 def calculate_next_due(from_date: date, frequency: str) -> date | None:
     """Calculate the next due date based on frequency."""
+    delta = FREQUENCY_DELTAS.get(frequency)
+    if delta is not None:
+        return from_date + delta
+    months = _FREQUENCY_MONTHS.get(frequency)
+    if months is not None:
+        return add_months(from_date, months)
     if frequency == FREQUENCY_ONCE:
         return None
-    if frequency == FREQUENCY_DAILY:
-        return from_date + timedelta(days=1)
-    if frequency == FREQUENCY_WEEKLY:
-        return from_date + timedelta(weeks=1)
-    if frequency == FREQUENCY_BIWEEKLY:
-        return from_date + timedelta(weeks=2)
-    if frequency == FREQUENCY_MONTHLY:
-        return from_date + relativedelta(months=1)
-    if frequency == FREQUENCY_BIMONTHLY:
-        return from_date + relativedelta(months=2)
-    if frequency == FREQUENCY_QUARTERLY:
-        return from_date + relativedelta(months=3)
-    if frequency == FREQUENCY_BIANNUAL:
-        return from_date + relativedelta(months=6)
-    if frequency == FREQUENCY_YEARLY:
-        return from_date + relativedelta(years=1)
     return from_date
 
 
@@ -79,21 +100,17 @@ def get_week_bounds(for_date: date) -> tuple[date, date]:
 def get_nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> date | None:
     """Get the nth occurrence of a weekday in a month."""
     python_weekday = (weekday - 1) % 7
-    first_day = date(year, month, 1)
-    days_in_month = calendar.monthrange(year, month)[1]
+    first_weekday = date(year, month, 1).weekday()
+    days_in_month = _days_in_month(year, month)
 
     if n == WEEK_LAST:
-        last_day = date(year, month, days_in_month)
-        days_back = (last_day.weekday() - python_weekday) % 7
-        return last_day - timedelta(days=days_back)
-
-    days_ahead = (python_weekday - first_day.weekday()) % 7
-    first_occurrence = first_day + timedelta(days=days_ahead)
-    result = first_occurrence + timedelta(weeks=n - 1)
+        last_weekday = (first_weekday + days_in_month - 1) % 7
+        return date(year, month, days_in_month - (last_weekday - python_weekday) % 7)
 
-    if result.month != month:
+    day = 1 + (python_weekday - first_weekday) % 7 + (n - 1) * 7
+    if day > days_in_month:
         return None
-    return result
+    return date(year, month, day)
 
 
 def calculate_next_anchored_weekly(
@@ -105,20 +122,16 @@ def calculate_next_anchored_weekly(
     if not anchor_days:
         return from_date + timedelta(weeks=interval)
 
-    sorted_days = sorted(anchor_days)
     current_dow = (from_date.weekday() + 1) % 7
 
-    for day in sorted_days:
-        if day > current_dow:
-            days_ahead = day - current_dow
-            return from_date + timedelta(days=days_ahead)
+    next_day = min((day for day in anchor_days if day > current_dow), default=None)
+    if next_day is not None:
+        return from_date + timedelta(days=next_day - current_dow)
 
-    first_anchor = sorted_days[0]
-    days_until_sunday = (7 - current_dow) % 7 or 7
-    days_from_sunday_to_anchor = first_anchor
+    days_until_anchor = 7 - current_dow + min(anchor_days)
     extra_weeks = (interval - 1) * 7
 
-    return from_date + timedelta(days=days_until_sunday + days_from_sunday_to_anchor + extra_weeks)
+    return from_date + timedelta(days=days_until_anchor + extra_weeks)
 
 
 def calculate_next_anchored_monthly(
@@ -133,22 +146,22 @@ def calculate_next_anchored_monthly(
     if anchor_type == ANCHOR_DAY_OF_MONTH:
         target_day = anchor_day_of_month or 1
         year, month = from_date.year, from_date.month
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _days_in_month(year, month)
         actual_day = min(target_day, days_in_month)
         target_date = date(year, month, actual_day)
 
         if target_date > from_date:
             return target_date
 
-        next_month_date = from_date + relativedelta(months=months_interval)
+        next_month_date = add_months(from_date, months_interval)
         year, month = next_month_date.year, next_month_date.month
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _days_in_month(year, month)
         actual_day = min(target_day, days_in_month)
         return date(year, month, actual_day)
 
     elif anchor_type == ANCHOR_WEEK_PATTERN:
         if anchor_week is None or anchor_weekday is None:
-            return from_date + relativedelta(months=months_interval)
+            return add_months(from_date, months_interval)
 
         year, month = from_date.year, from_date.month
         target_date = get_nth_weekday_of_month(year, month, anchor_weekday, anchor_week)
@@ -156,20 +169,20 @@ def calculate_next_anchored_monthly(
         if target_date and target_date > from_date:
             return target_date
 
-        next_month_date = from_date + relativedelta(months=months_interval)
+        next_month_date = add_months(from_date, months_interval)
         year, month = next_month_date.year, next_month_date.month
         target_date = get_nth_weekday_of_month(year, month, anchor_weekday, anchor_week)
 
         attempts = 0
         while target_date is None and attempts < 12:
-            next_month_date = next_month_date + relativedelta(months=1)
+            next_month_date = add_months(next_month_date, 1)
             year, month = next_month_date.year, next_month_date.month
             target_date = get_nth_weekday_of_month(year, month, anchor_weekday, anchor_week)
             attempts += 1
 
-        return target_date or from_date + relativedelta(months=months_interval)
+        return target_date or add_months(from_date, months_interval)
 
-    return from_date + relativedelta(months=months_interval)
+    return add_months(from_date, months_interval)
 
 
 def calculate_next_due_for_chore(chore: dict[str, Any], from_date: date) -> date | None:
@@ -191,13 +204,7 @@ def calculate_next_due_for_chore(chore: dict[str, Any], from_date: date) -> date
 
     elif frequency in (FREQUENCY_MONTHLY, FREQUENCY_BIMONTHLY, FREQUENCY_QUARTERLY, FREQUENCY_BIANNUAL):
         anchor_type = chore.get("anchor_type", ANCHOR_DAY_OF_MONTH)
-        months_map = {
-            FREQUENCY_MONTHLY: 1,
-            FREQUENCY_BIMONTHLY: 2,
-            FREQUENCY_QUARTERLY: 3,
-            FREQUENCY_BIANNUAL: 6,
-        }
-        months_interval = months_map.get(frequency, 1) * interval
+        months_interval = _FREQUENCY_MONTHS[frequency] * interval
         return calculate_next_anchored_monthly(
             from_date,
             anchor_type,
@@ -221,6 +228,27 @@ def calculate_next_due_for_chore(chore: dict[str, Any], from_date: date) -> date
     return calculate_next_due(from_date, frequency)
 
 
+class TestAddMonths:
+    """Tests for month arithmetic."""
+
+    def test_same_year(self):
+        """Adding months within a year keeps the day."""
+        assert add_months(date(2024, 6, 15), 2) == date(2024, 8, 15)
+
+    def test_year_rollover(self):
+        """Adding months past December rolls into the next year."""
+        assert add_months(date(2024, 11, 15), 3) == date(2025, 2, 15)
+
+    def test_clamps_to_end_of_month(self):
+        """Days past the end of the target month clamp to its last day."""
+        assert add_months(date(2024, 3, 31), 1) == date(2024, 4, 30)
+        assert add_months(date(2023, 1, 31), 1) == date(2023, 2, 28)
+
+    def test_twelve_months_from_leap_day(self):
+        """Twelve months from Feb 29 lands on Feb 28 in a non-leap year."""
+        assert add_months(date(2024, 2, 29), 12) == date(2025, 2, 28)
+
+
 class TestCalculateNextDue:
     """Tests for the basic calculate_next_due function."""
 